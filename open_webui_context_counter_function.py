@@ -11,9 +11,13 @@ description: Performant, lightweight context window tracker built with minimal l
 from __future__ import annotations
 
 import functools
-import hashlib
+import itertools
 import logging
-from typing import Any, Awaitable, Callable, Optional
+import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional
 
 import tiktoken
 from open_webui.models.models import Models
@@ -30,68 +34,151 @@ logging.basicConfig(
 logger = logging.getLogger("StandardContextCounter")
 
 DEFAULT_FALLBACK_CONTEXT_SIZE = 4096
-HARD_CODED_CONTEXTS = {
-    "gpt-4o": 128000,
-    "gpt-4-turbo": 128000,
-    "gpt-4-turbo-preview": 128000,
-    "gpt-4-vision-preview": 128000,
-    "gpt-4": 8192,
-    "gpt-4-32k": 32768,
-    "gpt-3.5-turbo": 16385,
-    "gpt-3.5-turbo-16k": 16385,
-    "claude-3.5-sonnet": 200000,
-    "claude-2.1": 200000,
-    "claude-2.0": 100000,
-    "claude-instant-1.2": 100000,
-    "gemini-2.5-pro-preview": 1048576,
-    "gemini-2.5-flash-preview": 1048576,
-    "gemini-pro": 30720,
-    "gemini-pro-vision": 12288,
-    "llama3-70b-8192": 8192,
-    "llama3-8b-8192": 8192,
-    "llama2-70b-4096": 4096,
-    "mistral-large-latest": 32768,
-    "mistral-medium-latest": 32768,
-    "mistral-small-latest": 32768,
-    "mistral-7b-instruct-v0.2": 32768,
-    "mixtral-8x7b-instruct-v0.1": 32768,
-}
+HARD_CODED_CONTEXTS: Mapping[str, int] = MappingProxyType(
+    {
+        "gpt-4o": 128000,
+        "gpt-4-turbo": 128000,
+        "gpt-4-turbo-preview": 128000,
+        "gpt-4-vision-preview": 128000,
+        "gpt-4": 8192,
+        "gpt-4-32k": 32768,
+        "gpt-3.5-turbo": 16385,
+        "gpt-3.5-turbo-16k": 16385,
+        "claude-3.5-sonnet": 200000,
+        "claude-2.1": 200000,
+        "claude-2.0": 100000,
+        "claude-instant-1.2": 100000,
+        "gemini-2.5-pro-preview": 1048576,
+        "gemini-2.5-flash-preview": 1048576,
+        "gemini-pro": 30720,
+        "gemini-pro-vision": 12288,
+        "llama3-70b-8192": 8192,
+        "llama3-8b-8192": 8192,
+        "llama2-70b-4096": 4096,
+        "mistral-large-latest": 32768,
+        "mistral-medium-latest": 32768,
+        "mistral-small-latest": 32768,
+        "mistral-7b-instruct-v0.2": 32768,
+        "mixtral-8x7b-instruct-v0.1": 32768,
+    }
+)
+
+_PROVIDER_PREFIXES = (
+    "openai/",
+    "anthropic/",
+    "google/",
+    "meta-llama/",
+    "mistralai/",
+    "ollama/",
+)
+
+# "<model-id> <context-size>" per line of custom_models_plaintext
+_OVERRIDE_RE = re.compile(r"(?m)^[ \t]*(\S+)[ \t]+(\d+)(?=\s|$)")
 
 _K, _M = 1_000, 1_000_000
 INDICATORS = ["⬡", "⬢"]
 
+# Below this many messages the threaded batch encoder costs more than it saves
+_BATCH_MIN_TEXTS = 4
+_BATCH_MAX_THREADS = 8
+
+# Per-Filter memo of message text hash -> token count
+_MSG_CACHE_MAX = 2048
+
+_ENCODER: Optional[tiktoken.Encoding] = None
+_ENCODER_LOCK = threading.Lock()
+
+
+def _get_encoder() -> tiktoken.Encoding:
+    """
+    Process-wide tiktoken encoder shared by every Filter instance.  Built
+    once (~30 ms) and warmed so the first real request skips lazy init.
+    """
+    global _ENCODER
+    if _ENCODER is None:
+        with _ENCODER_LOCK:
+            if _ENCODER is None:
+                enc = tiktoken.get_encoding("cl100k_base")
+                enc.encode_ordinary("warmup")
+                _ENCODER = enc
+    return _ENCODER
+
+
+try:  # pre-warm at import so no request pays the load
+    _get_encoder()
+except Exception as e:  # pragma: no cover (offline / missing BPE cache)
+    logger.warning("tiktoken pre-warm failed, will retry lazily: %s", e)
 
-def _sha1(text: str) -> str:
-    return hashlib.sha1(text.encode(), usedforsecurity=False).hexdigest()
 
+@functools.lru_cache(maxsize=512)
+def _normalise_id(model_id: str) -> str:
+    name = model_id.lower().strip()
+    for p in _PROVIDER_PREFIXES:
+        if name.startswith(p):
+            return name[len(p) :]
+    return name
 
+
+@functools.lru_cache(maxsize=1024)
 def _format_number(num: int) -> str:
+    # integer-only equivalent of f"{num / unit:.1f}" (rounds half up)
     if num >= _M:
-        return f"{num / _M:.1f}M"
+        q, r = divmod((num + _M // 20) // (_M // 10), 10)
+        return f"{q}.{r}M"
     if num >= _K:
-        return f"{num / _K:.1f}K"
+        q, r = divmod((num + _K // 20) // (_K // 10), 10)
+        return f"{q}.{r}K"
     return str(num)
 
 
+@functools.lru_cache(maxsize=256)
+def _format_limit(limit: int) -> str:
+    # own cache: per-request token counts would evict limits from _format_number's
+    return _format_number(limit)
+
+
+def _extract_text(content: str | list) -> str:
+    """Plain text of a message; vision messages keep only their text parts."""
+    if isinstance(content, str):
+        return content
+    return "\n".join(
+        p["text"] for p in content if p.get("type") == "text" and "text" in p
+    )
+
+
 def _build_bar(filled: int, total: int) -> str:
     return "[" + INDICATORS[1] * filled + INDICATORS[0] * (total - filled) + "]"
 
 
-@functools.lru_cache(maxsize=256)
-def _get_context_size_cached(
+# (model id, context-map version) -> context size.  Versions are
+# process-unique, so instances never collide and stale keys are never hit.
+_CTX_CACHE: dict[tuple[str, int], int] = {}
+_CTX_CACHE_MAX = 1024
+_CTX_VERSIONS = itertools.count(1)
+
+
+def _compute_context_size(
     raw_name: str,
     normalised: str,
-    ctx_items: frozenset[tuple[str, int]],
+    overrides: dict[str, int],
 ) -> int:
     """
-    Pure function suitable for LRU-caching.  Re-created when custom-model
-    overrides change (cache cleared by Filter._refresh_custom_models).
+    Resolve a context size from scratch.  Results are memoised in
+    ``_CTX_CACHE`` by Filter._get_context_size.
     """
-    ctx_map = dict(ctx_items)
-
     if not raw_name:
         return DEFAULT_FALLBACK_CONTEXT_SIZE
 
+    # known ids first: avoids a DB round-trip for the common case
+    hit = (
+        overrides.get(raw_name)
+        or overrides.get(normalised)
+        or HARD_CODED_CONTEXTS.get(raw_name)
+        or HARD_CODED_CONTEXTS.get(normalised)
+    )
+    if hit:
+        return hit
+
     lname = raw_name.lower()
     if "sonnet" in lname:
         return 128_000
@@ -105,11 +192,7 @@ def _get_context_size_cached(
     except Exception:
         pass
 
-    return (
-        ctx_map.get(raw_name)
-        or ctx_map.get(normalised)
-        or DEFAULT_FALLBACK_CONTEXT_SIZE
-    )
+    return DEFAULT_FALLBACK_CONTEXT_SIZE
 
 
 # --------------------------------------------------------------------------- #
@@ -154,20 +237,17 @@ class Filter:
         self.valves = self.Valves()
         logger.setLevel(getattr(logging, self.valves.log_level.upper(), logging.INFO))
 
-        self._encoder: Optional[tiktoken.Encoding] = None
-        self._custom_models_hash: str = ""
-        self._model_contexts: dict[str, int] = HARD_CODED_CONTEXTS.copy()
+        self._custom_models_txt: Optional[str] = None  # last text parsed
+        self._overrides: dict[str, int] = {}  # on top of HARD_CODED_CONTEXTS
+        self._ctx_version: int = 0
         self._refresh_custom_models()  # one-off at start-up
 
-        logger.info("Context counter initialised")
+        self._msg_token_cache: OrderedDict[int, int] = OrderedDict()
 
-    # ------------------------- heavyweight resources ----------------------- #
+        self._valve_key: Optional[tuple] = None
+        self._refresh_valve_cache()
 
-    def _encoder_fast(self) -> tiktoken.Encoding:
-        """Lazy-load and cache tiktoken encoder."""
-        if self._encoder is None:
-            self._encoder = tiktoken.get_encoding("cl100k_base")
-        return self._encoder
+        logger.info("Context counter initialised")
 
     # ------------------------- custom model support ----------------------- #
 
@@ -176,53 +256,127 @@ class Filter:
         Parse the plaintext overrides only when the text actually changes.
         """
         txt = self.valves.custom_models_plaintext
-        digest = _sha1(txt)
-        if digest == self._custom_models_hash:
+        # Compare by value: Open-WebUI hands over a fresh Valves (and string)
+        # per request, and equal text needs no fingerprint to detect it
+        if txt == self._custom_models_txt:
             return  # no change
+        self._custom_models_txt = txt
 
-        for line in txt.splitlines():
-            name, *rest = line.split()
-            if rest and rest[0].isdigit():
-                size = int(rest[0])
-                if size > 0:
-                    self._model_contexts[name] = size
+        overrides = {}
+        for name, raw_size in _OVERRIDE_RE.findall(txt):
+            size = int(raw_size)
+            if size > 0:
+                overrides[name] = size
+        self._overrides = overrides
 
-        self._custom_models_hash = digest
-        _get_context_size_cached.cache_clear()
+        self._ctx_version = next(_CTX_VERSIONS)
 
-    # ---------------------------- internals -------------------------------- #
+    # --------------------------- valve snapshot ---------------------------- #
+
+    def _refresh_valve_cache(self) -> None:
+        """
+        Re-derive valve constants (and the bar table) only when a valve value
+        changes.  Open-WebUI builds a fresh Valves object per request, and
+        valves can be edited in place, so the snapshot is keyed on the values
+        rather than the instance.
+        """
+        v = self.valves
+        key = (
+            v.show_status,
+            v.show_progress_bar,
+            v.warn_at_percentage,
+            v.critical_at_percentage,
+            v.max_turns,
+            v.turn_warn_at_percentage,
+            v.turn_critical_at_percentage,
+            v.show_turn_status,
+            v.bar_length,
+        )
+        if key == self._valve_key:
+            return
+        self._valve_key = key
+        self._show_status = bool(v.show_status)
+        self._show_bar = bool(v.show_progress_bar)
+        self._warn = float(v.warn_at_percentage)
+        self._crit = float(v.critical_at_percentage)
+        self._max_turns = int(v.max_turns)
+        self._turn_warn = float(v.turn_warn_at_percentage)
+        self._turn_crit = float(v.turn_critical_at_percentage)
+        self._show_turns = bool(v.show_turn_status)
+        n = self._bar_len = max(int(v.bar_length), 0)
+        self._bar_cache = [_build_bar(f, n) for f in range(n + 1)]
 
-    @staticmethod
-    def _normalise_id(model_id: str) -> str:
-        name = model_id.lower().strip()
-        for p in (
-            "openai/",
-            "anthropic/",
-            "google/",
-            "meta-llama/",
-            "mistralai/",
-            "ollama/",
-        ):
-            if name.startswith(p):
-                return name[len(p) :]
-        return name
+    # ---------------------------- internals -------------------------------- #
 
     def _get_context_size(self, model_name: str) -> int:
-        return _get_context_size_cached(
-            model_name,
-            self._normalise_id(model_name),
-            frozenset(self._model_contexts.items()),
-        )
+        key = (model_name, self._ctx_version)
+        size = _CTX_CACHE.get(key)
+        if size is None:
+            size = _compute_context_size(
+                model_name, _normalise_id(model_name), self._overrides
+            )
+            if len(_CTX_CACHE) >= _CTX_CACHE_MAX:
+                _CTX_CACHE.clear()
+            _CTX_CACHE[key] = size
+        return size
+
+    def _bar(self, filled: int) -> str:
+        """Indexed lookup into every possible bar for the current bar_length."""
+        return self._bar_cache[max(0, min(filled, self._bar_len))]
 
     def _count_tokens(self, text: str) -> int:
         if not text:
             return 0
         try:
-            return len(self._encoder_fast().encode_ordinary(text))
+            return len(_get_encoder().encode_ordinary(text))
         except Exception as e:  # pragma: no cover
             logger.error("Tokenisation error: %s", e)
             return len(text) // 4
 
+    def _count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """
+        Token count per text.  Long histories go through tiktoken's threaded
+        batch encoder; short ones stay serial to dodge thread start-up cost.
+        """
+        if len(texts) < _BATCH_MIN_TEXTS:
+            return list(map(self._count_tokens, texts))
+        try:
+            ids_list = _get_encoder().encode_ordinary_batch(
+                texts, num_threads=min(_BATCH_MAX_THREADS, len(texts))
+            )
+            return list(map(len, ids_list))
+        except Exception as e:  # pragma: no cover
+            logger.error("Batch tokenisation error: %s", e)
+            return list(map(self._count_tokens, texts))
+
+    def _count_tokens_cached(self, texts: list[str]) -> list[int]:
+        """
+        Token count per text, reusing counts for messages already seen.  Chat
+        history grows by a turn per request, so usually only the newest
+        messages reach the encoder.
+        """
+        cache = self._msg_token_cache
+        counts = [0] * len(texts)
+        missing: list[int] = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            n = cache.get(hash(text))
+            if n is None:
+                missing.append(i)
+            else:
+                cache.move_to_end(hash(text))
+                counts[i] = n
+
+        if missing:
+            fresh = self._count_tokens_batch([texts[i] for i in missing])
+            for i, n in zip(missing, fresh):
+                counts[i] = cache[hash(texts[i])] = n
+            while len(cache) > _MSG_CACHE_MAX:
+                cache.popitem(last=False)
+
+        return counts
+
     # --------------------------------------------------------------------- #
     #  Filter API                                                            #
     # --------------------------------------------------------------------- #
@@ -245,6 +399,12 @@ class Filter:
             if not __user__["valves"].get("enabled", True):
                 return body
 
+        self._refresh_valve_cache()
+
+        # token counts only feed the status line (and the debug log)
+        if not self._show_status and not logger.isEnabledFor(logging.DEBUG):
+            return body
+
         # refresh custom model cache if needed
         self._refresh_custom_models()
 
@@ -254,23 +414,22 @@ class Filter:
             if not msgs:
                 return body
 
-            # token counting (single encoder pass for totals)
-            all_texts, assistant_last = [], ""
-            for m in msgs:
-                text = m.get("content") or ""
-                if isinstance(text, list):  # vision messages
-                    text = "\n".join(
-                        item.get("text", "")
-                        for item in text
-                        if item.get("type") == "text"
-                    )
-                all_texts.append(text)
-                if m.get("role") == "assistant":
-                    assistant_last = text
+            # token counting (each message encoded exactly once)
+            texts = [_extract_text(m.get("content") or "") for m in msgs]
+            if not any(t and not t.isspace() for t in texts):
+                return body  # nothing to count, don't touch the encoder
+            assistant_idx = next(
+                (
+                    i
+                    for i in range(len(msgs) - 1, -1, -1)
+                    if msgs[i].get("role") == "assistant"
+                ),
+                -1,
+            )
 
-            enc = self._encoder_fast()
-            total = len(enc.encode_ordinary("\n".join(all_texts)))
-            output = len(enc.encode_ordinary(assistant_last)) if assistant_last else 0
+            counts = self._count_tokens_cached(texts)
+            total = sum(counts)
+            output = counts[assistant_idx] if assistant_idx >= 0 else 0
             input_tokens = total - output
 
             limit = self._get_context_size(model_id)
@@ -278,51 +437,34 @@ class Filter:
 
             token_prefix = (
                 "CRIT:"
-                if token_pct >= self.valves.critical_at_percentage
-                else "WARN:" if token_pct >= self.valves.warn_at_percentage else ""
+                if token_pct >= self._crit
+                else "WARN:" if token_pct >= self._warn else ""
             )
 
             # Calculate turns
             current_turns = len(msgs) // 2  # Each turn is user + assistant
-            max_turns = self.valves.max_turns
+            max_turns = self._max_turns
             turn_pct = 100.0 * current_turns / max_turns if max_turns > 0 else 0.0
 
             turn_prefix = (
-                (
-                    "CRIT:"
-                    if turn_pct >= self.valves.turn_critical_at_percentage
-                    else (
-                        "WARN:"
-                        if turn_pct >= self.valves.turn_warn_at_percentage
-                        else ""
-                    )
-                )
-                if self.valves.show_turn_status
-                else ""
-            )
-
-            turn_status = (
-                f"{turn_prefix}Turns: {current_turns}/{max_turns}"
-                if self.valves.show_turn_status
-                else ""
-            )
-
-            token_bar = (
-                _build_bar(
-                    int(self.valves.bar_length * token_pct / 100),
-                    self.valves.bar_length,
-                )
-                if self.valves.show_progress_bar
-                else ""
+                "CRIT:"
+                if turn_pct >= self._turn_crit
+                else "WARN:" if turn_pct >= self._turn_warn else ""
             )
 
             status_parts = [
-                f"{token_prefix}Tokens: {_format_number(total)}/{_format_number(limit)} ({token_pct:.1f}%)",
-                token_bar,
-                f"Input: {_format_number(input_tokens)} - Output: {_format_number(output)}",
-                turn_status,
+                f"{token_prefix}Tokens: {_format_number(total)}/{_format_limit(limit)} ({token_pct:.1f}%)"
             ]
-            status = " | ".join(p for p in status_parts if p)
+            if self._show_bar:
+                status_parts.append(
+                    self._bar(self._bar_len * total // limit if limit else 0)
+                )
+            status_parts.append(
+                f"Input: {_format_number(input_tokens)} - Output: {_format_number(output)}"
+            )
+            if self._show_turns:
+                status_parts.append(f"{turn_prefix}Turns: {current_turns}/{max_turns}")
+            status = " | ".join(status_parts)
 
             logger.debug(
                 "Context %s/%s tokens (%.1f%%) | Turns %s/%s | model=%s",
@@ -334,14 +476,14 @@ class Filter:
                 model_id,
             )
 
-            if self.valves.show_status:
+            if self._show_status:
                 await __event_emitter__(
                     {"type": "status", "data": {"description": status, "done": True}}
                 )
 
         except Exception:  # noqa: BLE001
             logger.exception("Context counter failed")
-            if self.valves.show_status:
+            if self._show_status:
                 try:
                     await __event_emitter__(
                         {
@@ -4,6 +4,7 @@ description: A comprehensive tool for interacting with Jira - search, view, crea
 repository: https://github.com/taylorwilsdon/open-webui-tools
 author: @taylorwilsdon
 author_url: https://github.com/taylorwilsdon
+requirements: httpx
 version: 1.0.3
 changelog:
   - 1.0.3: Improved date formatting, enhanced HTML content handling, better comment display
@@ -12,11 +13,19 @@ changelog:
   - 1.0.0: Initial release with comprehensive Jira integration capabilities
 """
 
+import asyncio
+import calendar
+import functools
+import importlib.util
 import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, Optional, List, Union
+import re
+import time
+from collections import OrderedDict, deque
 from datetime import datetime
-import requests
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Union
+
+import httpx
 from pydantic import BaseModel, Field, validator
 
 # Simple logging configuration
@@ -27,93 +36,230 @@ logging.basicConfig(
 # Get logger for this module
 logger = logging.getLogger("jira_tool")
 
+# Prefer orjson for (de)serialisation when installed; stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson
 
-class IssueFormatter:
-    """Helper class to format Jira issues consistently as markdown tables"""
+    def json_loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
 
-    @staticmethod
-    def format_date(date_str: str) -> str:
-        """Format a date string from Jira API to a more readable format"""
-        if not date_str or date_str == "Unknown":
-            return "Unknown"
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
 
-        try:
-            # Clean up the timezone part if it has an extra offset
-            if "+00:00" in date_str and (
-                "+" in date_str.split("+00:00")[1] or "-" in date_str.split("+00:00")[1]
+except ImportError:
+    json_loads = json.loads
+
+    # Compact separators to match orjson's output; the default ", " / ": "
+    # pads every request body for no benefit
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+# HTTP/2 multiplexing needs the optional `h2` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds an idle pooled connection is kept open.  httpx's 5s default drops
+# the connection between chat turns, so nearly every tool call paid a fresh
+# TCP+TLS handshake even though the client itself is reused.
+KEEPALIVE_EXPIRY = 30.0
+
+# Seconds to reuse slow-changing Jira data before fetching it again
+METADATA_CACHE_TTL = 600  # projects, issue types, priorities
+TRANSITIONS_CACHE_TTL = 30
+
+# Fields fetched for a full issue view
+ISSUE_FIELDS = "summary,description,status,assignee,reporter,created,updated,priority,issuetype,project"
+# Just what IssueFormatter.format_issue_details renders, for the tool views
+ISSUE_DETAIL_FIELDS = (
+    "summary,status,assignee,reporter,created,updated,priority,issuetype"
+)
+# The detail fields plus the first page of comments, embedded in the issue itself
+ISSUE_DETAIL_COMMENT_FIELDS = ISSUE_DETAIL_FIELDS + ",comment"
+# Just what Jira._parse_search_item reads from each search hit
+ISSUE_SEARCH_FIELDS = "summary,status,issuetype,priority,updated"
+
+# Cap on concurrent per-issue requests so fan-out doesn't trip Jira's rate limits
+ISSUE_FETCH_CONCURRENCY = 8
+
+# Parsed GET responses kept for ETag revalidation
+ETAG_CACHE_SIZE = 128
+
+# Responses retried inside the transport, before Jira._handle_response sees
+# them.  A 429 was not processed, so any method may retry it; the gateway
+# errors only retry idempotent methods so a POST is never applied twice.
+RETRY_STATUSES = {429, 502, 503, 504}
+RETRY_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt unless Retry-After says otherwise
+RETRY_AFTER_MAX = 30.0  # longer server-requested waits are returned, not slept
+
+# Adaptive (AIMD) cap on requests in flight per client: +AIMD_INCREASE while
+# responses are healthy and fast, *AIMD_DECREASE on throttling or gateway errors
+AIMD_INITIAL_CONCURRENCY = 4
+AIMD_MIN_CONCURRENCY = 1
+AIMD_MAX_CONCURRENCY = 16
+AIMD_INCREASE = 0.5
+AIMD_DECREASE = 0.5
+AIMD_TARGET_LATENCY = 2.0  # seconds; a slower latency EWMA stops the growth
+
+# Pause all requests once X-RateLimit-Remaining drops to this share of
+# X-RateLimit-Limit (never below 2), or for as long as Retry-After asks
+RATE_LIMIT_LOW_WATER = 0.10
+RATE_LIMIT_LOW_PAUSE = 1.0  # seconds, when low on budget without a Retry-After
+
+# Largest page requested from /search; Jira caps maxResults server-side anyway
+SEARCH_PAGE_SIZE = 100
+
+# A search matching this many times max_results is flagged as too broad
+BROAD_QUERY_FACTOR = 5
+
+# Operators/keywords that mark a search query as JQL rather than free text.
+# Keywords stay case-sensitive so prose like "login or signup" is still free text.
+JQL_OPERATOR_RE = re.compile(r"[=~<>]|\s(?:AND|OR|ORDER\s+BY)\s")
+
+# Bound str.format for one free-text search clause, so terms map straight
+# through it instead of building an f-string per term in Python code
+FREE_TEXT_CLAUSE = 'text ~ "{}"'.format
+
+# Line breaks and runs of spaces in HTML comment bodies, collapsed to a space.
+# Tabs and NBSP are left alone, and so is anything inside <pre>/<code> blocks.
+HTML_WHITESPACE_RE = re.compile(r"[ \n]{2,}|\n")
+HTML_PRESERVE_RE = re.compile(r"(<pre\b.*?</pre>|<code\b.*?</code>)", re.S | re.I)
+
+# Jira's fixed-width timestamp (e.g. 2025-03-10T12:34:56.000+0000), which
+# format_date renders straight from its digits without building a datetime
+JIRA_TIMESTAMP_RE = re.compile(
+    r"([1-9]\d{3})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.\d+)?"
+    r"(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?"
+)
+# A "+00:00" directly followed by a second offset, e.g. "...+00:00+0100"
+EXTRA_UTC_OFFSET_RE = re.compile(r"\+00:00(?=[+-]\d\d:?\d\d)")
+MONTH_ABBR = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)  # fmt: skip
+DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@functools.lru_cache(maxsize=4096)
+def format_date(date_str: str) -> str:
+    """
+    Format a date string from Jira API to a more readable format.  Cached,
+    since the same timestamps recur across issue lists and comment threads.
+    """
+    if not date_str or date_str == "Unknown":
+        return "Unknown"
+
+    try:
+        # Fast path for Jira's own format; anything else (or an impossible
+        # date, which fromisoformat rejects) goes through the full parser
+        match = JIRA_TIMESTAMP_RE.fullmatch(date_str)
+        if match:
+            year, month, day, hour, minute, second = map(int, match.groups())
+            if (
+                1 <= month <= 12
+                and 1 <= day <= DAYS_IN_MONTH[month - 1]
+                and ((month, day) != (2, 29) or calendar.isleap(year))
+                and hour < 24
+                and minute < 60
+                and second < 60
             ):
-                date_str = date_str.split("+00:00")[0] + date_str.split("+00:00")[1]
+                # Same output as strftime("%b %d, %Y %I:%M %p")
+                return (
+                    f"{MONTH_ABBR[month - 1]} {day:02d}, {year} "
+                    f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+                )
+
+        # Clean up the timezone part if it has an extra offset
+        date_str = EXTRA_UTC_OFFSET_RE.sub("", date_str, count=1)
+
+        # Parse ISO 8601 format
+        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+        # Format as "Mar 10, 2025 12:34 PM"
+        formatted_date = dt.strftime("%b %d, %Y %I:%M %p")
 
-            # Parse ISO 8601 format
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return formatted_date
 
-            # Format as "Mar 10, 2025 12:34 PM"
-            formatted_date = dt.strftime("%b %d, %Y %I:%M %p")
+    except (ValueError, TypeError) as e:
+        # Log the error but don't crash
+        logger.debug("Date parsing error: %s for string: %s", e, date_str)
+        # If parsing fails, return the original string
+        return date_str
 
-            return formatted_date
 
-        except (ValueError, TypeError) as e:
-            # Log the error but don't crash
-            logger.debug(f"Date parsing error: {e} for string: {date_str}")
-            # If parsing fails, return the original string
-            return date_str
+# Badge icons by lower-cased status / priority name; others get 🆕 / 🔽
+STATUS_ICONS = {
+    "done": "✅",
+    "closed": "✅",
+    "resolved": "✅",
+    "in progress": "🔄",
+    "in review": "🔄",
+}
+PRIORITY_ICONS = {"highest": "🔥", "high": "🔥", "medium": "⚡"}
+
+
+class IssueFormatter:
+    """Helper class to format Jira issues consistently as markdown tables"""
+
+    @staticmethod
+    def format_date(date_str: str) -> str:
+        """Format a date string from Jira API to a more readable format"""
+        return format_date(date_str)
 
     @staticmethod
     def format_issue_details(issue: Dict[str, Any]) -> str:
         """Format a single issue in Jira-style markdown"""
         # Define status and priority icons
-        status_icon = (
-            "✅"
-            if issue["status"].lower() in ["done", "closed", "resolved"]
-            else (
-                "🔄"
-                if issue["status"].lower() in ["in progress", "in review"]
-                else "🆕"
-            )
-        )
-        priority_icon = (
-            "🔥"
-            if issue["priority"].lower() in ["highest", "high"]
-            else "⚡" if issue["priority"].lower() == "medium" else "🔽"
-        )
-
-        # Format metadata badges
-        metadata_badges = (
+        status_icon = STATUS_ICONS.get(issue["status"].lower(), "🆕")
+        priority_icon = PRIORITY_ICONS.get(issue["priority"].lower(), "🔽")
+
+        # One f-string for the whole block, so CPython builds the result in a
+        # single pass.  created/updated arrive already formatted by
+        # Jira._parse_issue; re-formatting them only took the failing-parse path.
+        return (
+            f"## [{issue['key']}] {issue['title']}\n\n"
             f"`{status_icon} {issue['status']}`  "
             f"`{priority_icon} {issue['priority']}`  "
             f"`📋 {issue['type']}`  "
-            f"`🕒 {IssueFormatter.format_date(issue['created'])}`  "
-            f"`🔄 {IssueFormatter.format_date(issue['updated'])}`  "
+            f"`🕒 {issue['created']}`  "
+            f"`🔄 {issue['updated']}`  "
             f"`🙋 {issue['reporter']}`  "
-            f"`🕵️‍♂️ {issue['assignee']}`  "
+            f"`🕵️‍♂️ {issue['assignee']}`  \n\n"
         )
 
-        # Format the main content
-        return f"## [{issue['key']}] {issue['title']}\n\n" f"{metadata_badges}\n\n"
-
     @staticmethod
     def format_issue_list(
-        issues: List[Dict[str, Any]], total: int, displayed: int
+        issues: List[Dict[str, Any]], total: int, displayed: int, header: bool = True
     ) -> str:
-        """Format a list of issues as a markdown table"""
+        """
+        Format a list of issues as a markdown table.  With header=False only the
+        rows are returned, to continue a table already emitted page by page.
+        """
         if not issues:
             return "No issues found."
 
-        table = f"### Found {total} issues (showing {displayed})\n\n"
-        table += "| Key | Summary | Status | Type | Priority | Updated |\n"
-        table += "|-----|---------|--------|------|----------|--------|\n"
-
-        for issue in issues:
-            table += (
-                f"| [{issue['key']}]({issue['link']}) "
-                f"| {issue['summary']} "
-                f"| {issue['status']} "
-                f"| {issue['type']} "
-                f"| {issue['priority']} "
-                f"| {IssueFormatter.format_date(issue['updated'])} |\n"
-            )
+        rows = (
+            [
+                f"### Found {total} issues (showing {displayed})\n\n",
+                "| Key | Summary | Status | Type | Priority | Updated |\n",
+                "|-----|---------|--------|------|----------|--------|\n",
+            ]
+            if header
+            else []
+        )
+        rows.extend(
+            f"| [{issue['key']}]({issue['link']}) "
+            f"| {issue['summary']} "
+            f"| {issue['status']} "
+            f"| {issue['type']} "
+            f"| {issue['priority']} "
+            f"| {format_date(issue['updated'])} |\n"
+            for issue in issues
+        )
 
-        return table
+        return "".join(rows)
 
     @staticmethod
     def format_comments(issue_id: str, comments: List[Dict[str, Any]]) -> str:
@@ -121,32 +267,38 @@ class IssueFormatter:
         if not comments:
             return ""
 
-        comment_text = f"### 💬 Comments ({len(comments)})\n\n"
+        # Collect the pieces and join once; += on a long thread is quadratic
+        parts = [f"### 💬 Comments ({len(comments)})\n\n"]
         for comment in comments:
             # Handle HTML content in comments
             text = comment["text"]
             if text.startswith("<") and ">" in text:
-                # Clean up HTML content for better readability
-                text = text.replace("\n", " ")
-                # Remove excessive whitespace
-                while "  " in text:
-                    text = text.replace("  ", " ")
+                # Clean up HTML content for better readability: flatten line
+                # breaks and collapse space runs in one pass, outside code blocks
+                # (split() puts the preserved blocks at the odd indexes)
+                chunks = HTML_PRESERVE_RE.split(text)
+                chunks[::2] = [HTML_WHITESPACE_RE.sub(" ", c) for c in chunks[::2]]
+                text = "".join(chunks)
                 # Add line breaks after closing paragraph tags for better readability
                 text = text.replace("</p>", "</p>\n\n")
 
             # Format each comment in a more visually appealing style
-            comment_text += (
-                f"#### Comment by {comment['author']} on {IssueFormatter.format_date(comment['created'])}\n\n"
+            parts.append(
+                f"#### Comment by {comment['author']} on {format_date(comment['created'])}\n\n"
                 f"{text}\n\n"
                 "<div style='border-bottom: 1px solid #ddd; margin: 15px 0;'></div>\n\n"
             )
-        return comment_text
+        return "".join(parts)
+
+
+# str.translate table for markdown table cells: escape pipes and flatten
+# line breaks (a raw newline would end the row), all in one C-level pass
+MD_CELL_ESCAPE = str.maketrans({"|": "\\|", "\n": " ", "\r": " "})
 
 
 class EventEmitter:
     def __init__(self, event_emitter: Callable[[dict], Awaitable[None]]):
         self.event_emitter = event_emitter
-        self.logger = logging.getLogger("jira_tool.emitter")
 
     async def emit_status(
         self, description: str, done: bool, error: bool = False
@@ -169,7 +321,7 @@ class EventEmitter:
                 }
             )
         except Exception as e:
-            logger.error(f"Failed to emit status event: {str(e)}")
+            logger.error("Failed to emit status event: %s", e)
             raise RuntimeError(f"Failed to emit status event: {str(e)}") from e
 
     async def emit_message(self, content: str) -> None:
@@ -180,7 +332,7 @@ class EventEmitter:
         try:
             await self.event_emitter({"data": {"content": content}, "type": "message"})
         except Exception as e:
-            logger.error(f"Failed to emit message event: {str(e)}")
+            logger.error("Failed to emit message event: %s", e)
             raise RuntimeError(f"Failed to emit message event: {str(e)}") from e
 
     async def emit_source(
@@ -202,7 +354,7 @@ class EventEmitter:
                 }
             )
         except Exception as e:
-            logger.error(f"Failed to emit source event: {str(e)}")
+            logger.error("Failed to emit source event: %s", e)
             raise RuntimeError(f"Failed to emit source event: {str(e)}") from e
 
     async def emit_table(
@@ -218,31 +370,342 @@ class EventEmitter:
         if any(len(row) != len(headers) for row in rows):
             raise ValueError("All rows must have the same number of columns as headers")
 
-        # Create markdown table
-        table = (
-            f"### {title}\n\n|"
-            + "|".join(headers)
-            + "|\n|"
-            + "|".join(["---"] * len(headers))
-            + "|\n"
-        )
-
+        # Create markdown table, collecting lines and joining once at the end
+        lines = [
+            f"### {title}\n",
+            "|" + "|".join(headers) + "|",
+            "|" + "|".join(["---"] * len(headers)) + "|",
+        ]
         for row in rows:
-            # Convert all cells to strings and escape pipe characters
-            formatted_row = [str(cell).replace("|", "\\|") for cell in row]
-            table += "|" + "|".join(formatted_row) + "|\n"
+            # Convert all cells to strings, escaping pipes and line breaks
+            cells = "|".join(str(cell).translate(MD_CELL_ESCAPE) for cell in row)
+            lines.append(f"|{cells}|")
+        lines.append("")
 
-        await self.emit_message(table)
+        await self.emit_message("\n".join(lines))
 
 
 class JiraApiError(Exception):
     """Exception raised for Jira API errors"""
 
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failing response, None when there was none
+        self.status_code = status_code
+
+
+def _field_attr(
+    fields: Dict[str, Any], key: str, default: Any = "Unknown", attr: str = "name"
+) -> Any:
+    """
+    Read one attribute of a nested issue field, e.g. fields["status"]["name"],
+    falling back to default when Jira sends null (unset priority, assignee...)
+    """
+    value = fields.get(key)
+    return value.get(attr, default) if isinstance(value, dict) else default
+
+
+def _bad_request_message(response: httpx.Response, operation: str) -> str:
+    """Report Jira's first errorMessages entry, or the raw body if there is none"""
+    try:
+        error_details = json_loads(response.content)
+        return (
+            f"Bad request: {error_details.get('errorMessages', ['Unknown error'])[0]}"
+        )
+    except Exception:
+        return f"Bad request: {response.text}"
+
+
+# Error message builders by status code; anything else reports the raw body
+ERROR_MESSAGES: Dict[int, Callable[[httpx.Response, str], str]] = {
+    400: _bad_request_message,
+    401: lambda response, operation: (
+        "Authentication failed. Please check your username and API key."
+    ),
+    403: lambda response, operation: (
+        "You don't have permission to perform this operation."
+    ),
+    404: lambda response, operation: (
+        f"Resource not found while attempting to {operation}."
+    ),
+}
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """
+    Retry throttled and gateway-error responses with backoff, honouring
+    Retry-After, and idempotent requests whose connection drops mid-flight
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (httpx.ReadError, httpx.RemoteProtocolError) as e:
+                # A dropped keep-alive connection; safe to repeat only when the
+                # request is idempotent.  Read timeouts are not retried: each
+                # attempt would wait out the full read timeout again
+                if attempt == RETRY_ATTEMPTS or request.method not in RETRY_METHODS:
+                    raise
+                delay = RETRY_BACKOFF * 2**attempt
+                logger.warning(
+                    "%s %s failed (%s), retrying in %.1fs",
+                    request.method,
+                    request.url.path,
+                    type(e).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+            if attempt == RETRY_ATTEMPTS or not self._retryable(request, response):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            logger.warning(
+                "%s %s returned %s, retrying in %.1fs",
+                request.method,
+                request.url.path,
+                response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retryable(request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code not in RETRY_STATUSES:
+            return False
+        return response.status_code == 429 or request.method in RETRY_METHODS
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up now"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:  # HTTP-date form; fall back to backoff
+                pass
+            else:
+                return delay if delay <= RETRY_AFTER_MAX else None
+        return RETRY_BACKOFF * 2**attempt
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease bound on concurrent requests"""
+
+    def __init__(self, max_concurrency: int = AIMD_MAX_CONCURRENCY):
+        self.max_concurrency = max(AIMD_MIN_CONCURRENCY, max_concurrency)
+        self.limit = float(min(AIMD_INITIAL_CONCURRENCY, self.max_concurrency))
+        self.latency: Optional[float] = None  # EWMA, seconds
+        self._in_flight = 0
+        self._slot_freed = asyncio.Event()
+
+    async def acquire(self) -> None:
+        # Single event loop: nothing can interleave between the check and the
+        # increment, and waiters simply re-check after every release
+        while self._in_flight >= int(self.limit):
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+        self._in_flight += 1
+
+    def release(self, latency: Optional[float], overloaded: bool) -> None:
+        # latency is None when the request never completed (e.g. cancelled):
+        # free the slot without reading anything into it
+        if latency is None:
+            pass
+        elif overloaded:
+            self.limit = max(AIMD_MIN_CONCURRENCY, self.limit * AIMD_DECREASE)
+            logger.debug("Jira overloaded, concurrency cut to %d", int(self.limit))
+        else:
+            self.latency = (
+                latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            )
+            if self.latency <= AIMD_TARGET_LATENCY:
+                self.limit = min(self.max_concurrency, self.limit + AIMD_INCREASE)
+        self._in_flight -= 1
+        self._slot_freed.set()
+
+
+class RateLimitState:
+    """Jira's advertised rate-limit budget, used to pause before hitting a 429"""
+
+    def __init__(self):
+        self.paused_until = 0.0  # time.monotonic() deadline
+
+    def observe(self, response: httpx.Response) -> None:
+        headers = response.headers
+        pause = None
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                pause = RATE_LIMIT_LOW_PAUSE
+        else:
+            try:
+                remaining = int(headers["X-RateLimit-Remaining"])
+                limit = int(headers.get("X-RateLimit-Limit", 0))
+            except (KeyError, ValueError):
+                return
+            if remaining <= max(2, RATE_LIMIT_LOW_WATER * limit):
+                pause = RATE_LIMIT_LOW_PAUSE
+        if pause and pause > 0:
+            pause = min(pause, RETRY_AFTER_MAX)
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+            logger.debug("Jira rate limit budget low, pausing for %.1fs", pause)
+
+    async def wait(self) -> None:
+        delay = self.paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SlidingWindowLimiter:
+    """At most `rpm` request starts in any trailing 60 seconds"""
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self._starts: "deque[float]" = deque()
+
+    def delay(self, now: float) -> float:
+        """Seconds until another request may start, 0 if one may start now"""
+        while self._starts and now - self._starts[0] >= 60.0:
+            self._starts.popleft()
+        if len(self._starts) < self.rpm:
+            return 0.0
+        return 60.0 - (now - self._starts[0])
+
+    def record(self, now: float) -> None:
+        self._starts.append(now)
+
+
+# One request window per Jira base URL, shared by every client built for it
+_RPM_LIMITERS: Dict[str, SlidingWindowLimiter] = {}
+
+
+def rpm_limiter(base_url: str, rpm: int) -> Optional[SlidingWindowLimiter]:
+    """Return the shared window for base_url, or None when rpm is 0 (unlimited)"""
+    if rpm <= 0:
+        return None
+    limiter = _RPM_LIMITERS.get(base_url)
+    if limiter is None:
+        limiter = _RPM_LIMITERS[base_url] = SlidingWindowLimiter(rpm)
+    limiter.rpm = rpm
+    return limiter
+
+
+class LeakyBucketPacer:
+    """Space request starts at least 1/rps seconds apart, however fast they finish"""
+
+    def __init__(self, rps: float):
+        self.rps = rps
+        self._last_start: Optional[float] = None
+
+    def delay(self, now: float) -> float:
+        """Seconds until another request may start, 0 if one may start now"""
+        if self._last_start is None:
+            return 0.0
+        return self._last_start + 1.0 / self.rps - now
+
+    def record(self, now: float) -> None:
+        self._last_start = now
+
+
+# One pacer per Jira base URL, shared by every client built for it
+_PACERS: Dict[str, LeakyBucketPacer] = {}
+
+
+def request_pacer(base_url: str, rps: float) -> Optional[LeakyBucketPacer]:
+    """Return the shared pacer for base_url, or None when rps is 0 (unpaced)"""
+    if rps <= 0:
+        return None
+    pacer = _PACERS.get(base_url)
+    if pacer is None:
+        pacer = _PACERS[base_url] = LeakyBucketPacer(rps)
+    pacer.rps = rps
+    return pacer
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """
+    Gate every request attempt through the client's rate-limit pause, the
+    AIMD concurrency limiter and, last, the optional per-minute window and
+    pacer, which record the start at the moment it is sent
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        limiter: AIMDLimiter,
+        rate_limit: RateLimitState,
+        window: Optional[SlidingWindowLimiter] = None,
+        pacer: Optional[LeakyBucketPacer] = None,
+    ):
+        self._transport = transport
+        self._limiter = limiter
+        self._rate_limit = rate_limit
+        # Checked after the AIMD slot is held, right before dispatch
+        self._gates = [gate for gate in (window, pacer) if gate is not None]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._rate_limit.wait()
+        await self._limiter.acquire()
+        latency, overloaded = None, False
+        try:
+            await self._wait_for_gates()
+            started = time.monotonic()
+            response = await self._transport.handle_async_request(request)
+            self._rate_limit.observe(response)
+            latency = time.monotonic() - started
+            overloaded = response.status_code in RETRY_STATUSES
+            return response
+        except httpx.TransportError:
+            # A connection error counts as overload; a cancellation (search
+            # stopping early) or any other exception says nothing about Jira
+            latency, overloaded = time.monotonic() - started, True
+            raise
+        finally:
+            self._limiter.release(latency, overloaded)
+
+    async def _wait_for_gates(self) -> None:
+        """
+        Sleep until every gate lets a request start, then record it in all of
+        them with no await left before the send, so they count actual sends
+        rather than requests that later stall in another queue
+        """
+        while self._gates:
+            now = time.monotonic()
+            delay = max(gate.delay(now) for gate in self._gates)
+            if delay <= 0:
+                for gate in self._gates:
+                    gate.record(now)
+                return
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 class Jira:
-    def __init__(self, username: str, password: str, base_url: str, pat: str = ""):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str,
+        pat: str = "",
+        requests_per_minute: int = 0,
+        max_concurrent_requests: int = AIMD_MAX_CONCURRENCY,
+        requests_per_second: float = 0,
+    ):
         self.logger = logging.getLogger("jira_tool.api")
         self.base_url = base_url.rstrip("/")
         self.username = username
@@ -255,10 +718,61 @@ class Jira:
         if self.pat:
             self.headers["Authorization"] = f"Bearer {self.pat}"
         self.api_version = "latest"
+        self._cache: Dict[str, tuple] = {}  # endpoint -> (expires_at, result)
+        # (endpoint, params) -> (etag, result), LRU-bounded to ETAG_CACHE_SIZE
+        self._etag_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Server-side maxResults cap for /search, learned from the first response
+        self._server_max_results: Optional[int] = None
+        # Tool calls using this client, and whether a newer client replaced it
+        self._users = 0
+        self._retired = False
+
+        # Adapts how many requests this client keeps in flight to Jira's health,
+        # never above max_concurrent_requests across every tool call sharing it
+        self.limiter = AIMDLimiter(max_concurrent_requests)
+        self.rate_limit = RateLimitState()
+
+        # Shared non-blocking client; keep-alive reuses the TCP/TLS connection
+        self.client = httpx.AsyncClient(
+            base_url=f"{self.base_url}/rest/api/{self.api_version}/",
+            headers=self.headers,
+            auth=self._get_auth(),
+            timeout=httpx.Timeout(30.0, connect=3.05),
+            # Pool limits belong on the transport: AsyncClient ignores its own
+            # limits= argument whenever a custom transport is supplied
+            transport=RetryTransport(
+                ThrottledTransport(
+                    httpx.AsyncHTTPTransport(
+                        retries=3,
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_connections=100,
+                            max_keepalive_connections=20,
+                            keepalive_expiry=KEEPALIVE_EXPIRY,
+                        ),
+                    ),
+                    self.limiter,
+                    self.rate_limit,
+                    rpm_limiter(self.base_url, requests_per_minute),
+                    request_pacer(self.base_url, requests_per_second),
+                )
+            ),
+        )
+
         self.logger.info(
-            f"Initialized Jira client for {self.base_url} (API version: {self.api_version})"
+            "Initialized Jira client for %s (API version: %s)",
+            self.base_url,
+            self.api_version,
+        )
+        self.logger.debug(
+            "Using %s authentication", "PAT" if self.pat else "Basic Auth"
         )
-        self.logger.debug(f"Using {'PAT' if self.pat else 'Basic Auth'} authentication")
+
+    def _debug_json(self, label: str, data: Any, limit: Optional[int] = None):
+        """Log data as JSON at DEBUG, serialising it only when DEBUG is enabled"""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            dumped = json_dumps(data) if data else "None"
+            self.logger.debug("%s: %s", label, dumped[:limit])
 
     def _get_auth(self):
         """Return appropriate auth tuple or None based on authentication method"""
@@ -266,240 +780,429 @@ class Jira:
             return None
         return (self.username, self.password)
 
-    def _handle_response(self, response: requests.Response, operation: str):
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "Jira":
+        self._users += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._users -= 1
+        if self._retired and not self._users:
+            await self.aclose()
+
+    async def retire(self) -> None:
+        """Close this client as soon as no tool call is using it any more"""
+        self._retired = True
+        if not self._users:
+            await self.aclose()
+
+    def _handle_response(self, response: httpx.Response, operation: str):
         """Handle API response and raise appropriate exceptions"""
         if response.status_code >= 200 and response.status_code < 300:
             if not response.content:
                 return {}
 
             try:
-                return response.json()
+                return json_loads(response.content)
             except json.JSONDecodeError as e:
                 raise JiraApiError(f"Invalid JSON response: {str(e)}") from e
 
         # Create appropriate error message based on status code
-        error_msg = f"Jira API error ({response.status_code}): {response.text}"
-        if response.status_code == 401:
-            error_msg = "Authentication failed. Please check your username and API key."
-        elif response.status_code == 403:
-            error_msg = "You don't have permission to perform this operation."
-        elif response.status_code == 404:
-            error_msg = f"Resource not found while attempting to {operation}."
-        elif response.status_code == 400:
-            try:
-                error_details = response.json()
-                error_msg = f"Bad request: {error_details.get('errorMessages', ['Unknown error'])[0]}"
-            except:
-                error_msg = f"Bad request: {response.text}"
-
-        raise JiraApiError(error_msg)
+        build = ERROR_MESSAGES.get(response.status_code)
+        if build:
+            raise JiraApiError(build(response, operation), response.status_code)
+        raise JiraApiError(
+            f"Jira API error ({response.status_code}): {response.text}",
+            response.status_code,
+        )
 
-    def get(self, endpoint: str, params: Dict[str, Any] = None):
+    async def get(self, endpoint: str, params: Dict[str, Any] = None):
         url = f"{self.base_url}/rest/api/{self.api_version}/{endpoint}"
-        self.logger.info(f"GET request to {url}")
-        self.logger.debug(f"Request params: {params}")
+        self.logger.info("GET request to %s", url)
+        self.logger.debug("Request params: %s", params)
+
+        # Revalidate with the stored ETag; a 304 skips the body and the JSON parse
+        cache_key = (endpoint, frozenset((params or {}).items()))
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
 
         try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=self.headers,
-                auth=self._get_auth(),
-                timeout=30,
-            )
-            self.logger.debug(f"Response status: {response.status_code}")
-            return self._handle_response(response, f"get {endpoint}")
-        except requests.RequestException as e:
+            response = await self.client.get(endpoint, params=params, headers=headers)
+            self.logger.debug("Response status: %s", response.status_code)
+            if response.status_code == 304 and cached:
+                self._etag_cache.move_to_end(cache_key)
+                return cached[1]
+
+            result = self._handle_response(response, f"get {endpoint}")
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[cache_key] = (etag, result)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+            return result
+        except httpx.HTTPError as e:
             self.logger.error(
-                f"Request failed for GET {endpoint}: {str(e)}", exc_info=True
+                "Request failed for GET %s: %s", endpoint, e, exc_info=True
             )
             raise JiraApiError(f"Request failed: {str(e)}") from e
 
-    def post(self, endpoint: str, data: Dict[str, Any]):
+    async def _cached_get(self, endpoint: str, ttl: float):
+        """GET an endpoint, reusing the parsed result for `ttl` seconds"""
+        hit = self._cache.get(endpoint)
+        if hit and hit[0] > time.monotonic():
+            self.logger.debug("Cache hit for %s", endpoint)
+            return hit[1]
+        result = await self.get(endpoint)
+        self._cache[endpoint] = (time.monotonic() + ttl, result)
+        return result
+
+    def invalidate_metadata(self) -> None:
+        """Drop TTL-cached projects, issue types, priorities and transitions"""
+        self._cache.clear()
+
+    async def post(self, endpoint: str, data: Dict[str, Any]):
         url = f"{self.base_url}/rest/api/{self.api_version}/{endpoint}"
-        self.logger.info(f"POST request to {url}")
-        self.logger.debug(f"Request data: {json.dumps(data)[:1000]}")
+        self.logger.info("POST request to %s", url)
+        body = json_dumps(data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Request data: %s", body[:1000])
 
         try:
-            response = requests.post(
-                url, json=data, headers=self.headers, auth=self._get_auth(), timeout=30
-            )
+            response = await self.client.post(endpoint, content=body)
             return self._handle_response(response, f"post to {endpoint}")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(
-                f"Request failed for POST {endpoint}: {str(e)}", exc_info=True
+                "Request failed for POST %s: %s", endpoint, e, exc_info=True
             )
             raise JiraApiError(f"Request failed: {str(e)}") from e
 
-    def put(self, endpoint: str, data: Dict[str, Any]):
+    async def put(self, endpoint: str, data: Dict[str, Any]):
         url = f"{self.base_url}/rest/api/{self.api_version}/{endpoint}"
-        self.logger.info(f"PUT request to {url}")
-        self.logger.debug(f"Request data: {json.dumps(data)[:1000]}")
+        self.logger.info("PUT request to %s", url)
+        body = json_dumps(data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Request data: %s", body[:1000])
 
         try:
-            response = requests.put(
-                url, json=data, headers=self.headers, auth=self._get_auth(), timeout=30
-            )
+            response = await self.client.put(endpoint, content=body)
             return self._handle_response(response, f"update {endpoint}")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(
-                f"Request failed for PUT {endpoint}: {str(e)}", exc_info=True
+                "Request failed for PUT %s: %s", endpoint, e, exc_info=True
             )
             raise JiraApiError(f"Request failed: {str(e)}") from e
 
-    def get_issue(
+    async def get_issue(
         self,
         issue_id: str,
-        fields: str = "summary,description,status,assignee,reporter,created,updated,priority,issuetype,project",
+        fields: str = ISSUE_FIELDS,
+        render_html: bool = False,
     ):
-        """Get detailed information about a specific Jira issue"""
-        self.logger.info(f"Getting issue details for {issue_id}")
+        """
+        Get detailed information about a specific Jira issue.  The server only
+        renders the description to HTML when render_html is set, as that is the
+        costliest part of the fetch; otherwise the raw description is returned.
+        """
+        self.logger.info("Getting issue details for %s", issue_id)
         endpoint = f"issue/{issue_id}"
+        params = {"fields": fields}
+        if render_html:
+            params["expand"] = "renderedFields,names"
 
         try:
-            result = self.get(
-                endpoint, {"fields": fields, "expand": "renderedFields,names"}
-            )
+            result = await self.get(endpoint, params)
 
             # Debug the response structure
-            self.logger.debug(f"Raw result type for {issue_id}: {type(result)}")
+            self.logger.debug("Raw result type for %s: %s", issue_id, type(result))
             if result is None:
-                self.logger.error(f"API returned None result for {issue_id}")
+                self.logger.error("API returned None result for %s", issue_id)
                 raise JiraApiError(f"Empty response received for issue {issue_id}")
 
             # Check if fields exists in result
             if "fields" not in result:
-                self.logger.error(f"Missing 'fields' in response for {issue_id}")
+                self.logger.error("Missing 'fields' in response for %s", issue_id)
                 self.logger.debug(
-                    f"Response keys: {list(result.keys()) if result else 'No keys'}"
+                    "Response keys: %s", list(result.keys()) if result else "No keys"
                 )
                 raise JiraApiError(
                     f"Invalid response structure: missing 'fields' for issue {issue_id}"
                 )
 
-            # Create a structured issue data object with proper fallbacks
-            issue_data = {
-                "key": issue_id,
-                "title": result["fields"].get("summary", "No summary"),
-                "status": (result["fields"].get("status", {}) or {}).get(
-                    "name", "Unknown"
-                ),
-                "type": (result["fields"].get("issuetype", {}) or {}).get(
-                    "name", "Unknown"
-                ),
-                "project": (result["fields"].get("project", {}) or {}).get(
-                    "name", "Unknown"
-                ),
-                "priority": (result["fields"].get("priority", {}) or {}).get(
-                    "name", "Not set"
-                ),
-                "created": IssueFormatter.format_date(
-                    result["fields"].get("created", "Unknown")
-                ),
-                "updated": IssueFormatter.format_date(
-                    result["fields"].get("updated", "Unknown")
-                ),
-                "reporter": (result["fields"].get("reporter", {}) or {}).get(
-                    "displayName", self.username
-                ),
-                "assignee": (result["fields"].get("assignee", {}) or {}).get(
-                    "displayName", "Unassigned"
-                ),
-                "link": f"{self.base_url}/browse/{issue_id}",
-            }
-
-            # Handle description with better error checking
-            description_html = None
-
-            # Try to get rendered description
-            if result.get("renderedFields") and result["renderedFields"].get(
-                "description"
-            ):
-                description_html = result["renderedFields"]["description"]
-            # If no rendered description, try raw description
-            elif result["fields"].get("description"):
-                description_html = f"<p>{result['fields']['description']}</p>"
-            else:
-                description_html = "<p><em>No description provided</em></p>"
-
-            issue_data["description"] = description_html
+            issue_data = self._parse_issue(result, issue_id, render_html)
 
-            self.logger.debug(f"Successfully retrieved issue {issue_id}")
+            self.logger.debug("Successfully retrieved issue %s", issue_id)
             return issue_data
 
         except KeyError as e:
-            self.logger.error(
-                f"Missing field in issue response: {str(e)}", exc_info=True
-            )
-            self.logger.debug(
-                f"Response structure: {json.dumps(result)[:500] if result else 'None'}"
-            )
+            self.logger.error("Missing field in issue response: %s", e, exc_info=True)
+            self._debug_json("Response structure", result, 500)
             raise JiraApiError(f"Invalid response structure: missing {str(e)}") from e
 
-    def search(self, query: str, max_results: int = 10):
-        """Search for Jira issues using JQL or free text"""
-        self.logger.info(f"Searching issues with query: {query}")
-        endpoint = "search"
+    def _parse_issue(
+        self, result: Dict[str, Any], issue_id: str, render_html: bool = False
+    ) -> Dict[str, Any]:
+        """Flatten a raw issue payload into the structure used by the formatters"""
+        # Bind the field maps once instead of re-indexing result per field
+        f = result["fields"]
 
-        # Determine if the query is already JQL or needs conversion
-        if any(
-            operator in query
-            for operator in ["=", "~", ">", "<", " AND ", " OR ", " ORDER BY "]
-        ):
-            jql = query
-            self.logger.debug("Query appears to be JQL")
+        # Create a structured issue data object with proper fallbacks
+        issue_data = {
+            "key": issue_id,
+            "title": f.get("summary", "No summary"),
+            "status": _field_attr(f, "status"),
+            "type": _field_attr(f, "issuetype"),
+            "project": _field_attr(f, "project"),
+            "priority": _field_attr(f, "priority", "Not set"),
+            "created": format_date(f.get("created", "Unknown")),
+            "updated": format_date(f.get("updated", "Unknown")),
+            "reporter": _field_attr(f, "reporter", self.username, "displayName"),
+            "assignee": _field_attr(f, "assignee", "Unassigned", "displayName"),
+            "link": f"{self.base_url}/browse/{issue_id}",
+        }
+
+        # With the comment field requested Jira embeds the first page of
+        # comments; comment_total says whether that page is all of them
+        comment = f.get("comment")
+        if isinstance(comment, dict):
+            raw_comments = comment.get("comments", [])
+            issue_data["comments"] = self._parse_comments(raw_comments)
+            issue_data["comment_total"] = comment.get("total", len(raw_comments))
+
+        if not render_html:
+            issue_data["description"] = f.get("description") or ""
+            return issue_data
+
+        # Handle description with better error checking
+        description_html = None
+        rf = result.get("renderedFields") or {}
+
+        # Try to get rendered description
+        if rf.get("description"):
+            description_html = rf["description"]
+        # If no rendered description, try raw description
+        elif f.get("description"):
+            description_html = f"<p>{f['description']}</p>"
         else:
-            # Convert free text to JQL
-            terms = query.split()
-            if terms:
-                cql_terms = " OR ".join([f'text ~ "{term}"' for term in terms])
-            else:
-                cql_terms = f'text ~ "{query}"'
-            jql = cql_terms
-            self.logger.debug(f"Converted free text to JQL: {jql}")
+            description_html = "<p><em>No description provided</em></p>"
+
+        issue_data["description"] = description_html
+        return issue_data
 
+    async def get_issues_bulk(
+        self,
+        issue_ids: List[str],
+        fields: str = ISSUE_FIELDS,
+        render_html: bool = False,
+    ):
+        """Fetch up to a page of issues with one `key in (...)` search instead of N GETs"""
+        self.logger.info("Bulk fetching %s issues", len(issue_ids))
         params = {
-            "jql": jql,
-            "maxResults": max_results,
-            "fields": "summary,status,issuetype,priority,updated",
+            "jql": f"key in ({','.join(issue_ids)})",
+            "fields": fields,
+            "maxResults": len(issue_ids),
         }
-        raw_response = self.get(endpoint, params)
+        if render_html:
+            params["expand"] = "renderedFields"
+        raw_response = await self.get("search", params)
+        return [
+            self._parse_issue(item, item["key"], render_html)
+            for item in raw_response.get("issues", [])
+        ]
 
-        issues = []
-        for item in raw_response.get("issues", []):
+    async def batch_get_issues(
+        self,
+        issue_ids: List[str],
+        fields: str = ISSUE_FIELDS,
+        concurrency: int = ISSUE_FETCH_CONCURRENCY,
+        render_html: bool = False,
+    ):
+        """
+        Fetch several issues, one failure doesn't abort the rest.  Tries a single
+        bulk search first, then fetches whatever it didn't return with
+        concurrent per-issue GETs: `key in (...)` fails outright if any one key
+        is invalid, returns moved issues under their new key, and may be cut
+        short by the server's maxResults cap.
+        """
+        self.logger.info("Getting %s issues", len(issue_ids))
+        found: Dict[str, Dict[str, Any]] = {}
+        if 1 < len(issue_ids) <= (self._server_max_results or SEARCH_PAGE_SIZE):
             try:
-                issues.append(
-                    {
-                        "key": item["key"],
-                        "summary": item["fields"].get("summary", "No summary"),
-                        "status": item["fields"]
-                        .get("status", {})
-                        .get("name", "Unknown"),
-                        "type": item["fields"]
-                        .get("issuetype", {})
-                        .get("name", "Unknown"),
-                        "priority": item["fields"]
-                        .get("priority", {})
-                        .get("name", "Not set"),
-                        "updated": item["fields"].get("updated", "Unknown"),
-                        "link": f"{self.base_url}/browse/{item['key']}",
-                    }
-                )
-            except KeyError as e:
-                self.logger.warning(f"Missing field in search result item: {e}")
-                # Continue processing other results rather than failing completely
+                found = {
+                    issue["key"].upper(): issue
+                    for issue in await self.get_issues_bulk(
+                        issue_ids, fields, render_html
+                    )
+                }
+            except JiraApiError as e:
+                self.logger.debug("Bulk fetch failed, fetching individually: %s", e)
+
+        missing = [i for i in issue_ids if i.upper() not in found]
+        if found and missing:
+            self.logger.debug("Bulk fetch missed %s, fetching individually", missing)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(issue_id: str):
+            async with semaphore:
+                return await self.get_issue(issue_id, fields, render_html)
+
+        results = await asyncio.gather(
+            *(fetch_one(issue_id) for issue_id in missing), return_exceptions=True
+        )
+        fetched = dict(zip(missing, results))
+
+        issues, failures = [], []
+        for issue_id in issue_ids:
+            result = found.get(issue_id.upper()) or fetched.get(issue_id)
+            if isinstance(result, Exception):
+                self.logger.warning("Failed to get issue %s: %s", issue_id, result)
+                failures.append({"key": issue_id, "error": str(result)})
+            else:
+                issues.append(result)
+        return {"issues": issues, "failures": failures}
+
+    def _build_jql(self, query: str) -> str:
+        """Return the query as-is if it is JQL, otherwise convert free text to JQL"""
+        if JQL_OPERATOR_RE.search(query):
+            self.logger.debug("Query appears to be JQL")
+            return query
+
+        # Convert free text to JQL, one OR'd clause per term
+        jql = " OR ".join(map(FREE_TEXT_CLAUSE, query.split() or [""]))
+        self.logger.debug("Converted free text to JQL: %s", jql)
+        return jql
+
+    def _parse_search_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Flatten a raw search hit, or return None if it is missing required fields"""
+        try:
+            key = item["key"]
+            fields = item["fields"]
+            return {
+                "key": key,
+                "summary": fields.get("summary", "No summary"),
+                "status": _field_attr(fields, "status"),
+                "type": _field_attr(fields, "issuetype"),
+                "priority": _field_attr(fields, "priority", "Not set"),
+                "updated": fields.get("updated", "Unknown"),
+                "link": f"{self.base_url}/browse/{key}",
+            }
+        except KeyError as e:
+            self.logger.warning("Missing field in search result item: %s", e)
+            # Continue processing other results rather than failing completely
+            return None
+
+    async def search_iter(
+        self, query: str, max_results: int = 10, batch_size: int = SEARCH_PAGE_SIZE
+    ):
+        """
+        Async generator over search result pages, each {"issues": [...], "total": n}.
+        Pages hold up to batch_size issues, or the server's cap if that is lower.
+        With offset pagination the first page reveals the total, so the
+        remaining pages are all requested at once and handed back in order; the
+        client's AIMD limiter decides how many of them are actually in flight.  Cursor pages
+        (nextPageToken) can only be fetched one after another, so just the next
+        one is prefetched while the current page is processed.
+        """
+        self.logger.info("Searching issues with query: %s", query)
+        jql = self._build_jql(query)
+        page_size = min(batch_size, self._server_max_results or batch_size)
+
+        def fetch(start: int, token: Optional[str]):
+            params = {
+                "jql": jql,
+                "startAt": start,
+                "maxResults": min(max_results - start, page_size),
+                "fields": ISSUE_SEARCH_FIELDS,
+            }
+            if token:  # cursor-based pagination (Jira Cloud)
+                params["nextPageToken"] = token
+            return asyncio.create_task(self.get("search", params))
+
+        fetched = 0
+        pending = [fetch(0, None)]
+        try:
+            while pending:
+                raw_response = await pending.pop(0)
+
+                raw_issues = raw_response.get("issues", [])
+                total = raw_response.get("total", 0)
+                first_page = fetched == 0
+                fetched += len(raw_issues)
+
+                if first_page:
+                    page_size = self._learn_page_cap(
+                        raw_response, min(max_results, page_size), page_size
+                    )
+
+                token = raw_response.get("nextPageToken")
+                if raw_issues and token and fetched < max_results:
+                    pending.append(fetch(fetched, token))
+                elif raw_issues and first_page and not token:
+                    pending.extend(
+                        fetch(start, None)
+                        for start in range(fetched, min(total, max_results), page_size)
+                    )
+
+                issues = [self._parse_search_item(item) for item in raw_issues]
+                yield {"issues": [i for i in issues if i], "total": total}
+        finally:
+            for task in pending:
+                task.cancel()
+            # Collect the cancelled (or already failed) prefetches so none is
+            # left with an exception that is never retrieved
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _learn_page_cap(
+        self, raw_response: Dict[str, Any], asked: int, page_size: int
+    ) -> int:
+        """Remember a lower server maxResults cap so later searches ask for it directly"""
+        served = raw_response.get("maxResults")
+        if not isinstance(served, int):
+            # Not echoed back: a short first page that isn't the last reveals it
+            returned = len(raw_response.get("issues", []))
+            served = returned if raw_response.get("total", 0) > returned else 0
+        if served <= 0 or served >= asked:
+            return page_size
+        if served != self._server_max_results:
+            self.logger.warning(
+                "Search page size %s exceeds the server cap of %s, using %s",
+                asked,
+                served,
+                served,
+            )
+            self._server_max_results = served
+        return served
+
+    async def search(
+        self, query: str, max_results: int = 10, batch_size: int = SEARCH_PAGE_SIZE
+    ):
+        """Search for Jira issues using JQL or free text"""
+        issues, total = [], 0
+        pages = self.search_iter(query, max_results, batch_size)
+        try:
+            async for page in pages:
+                issues.extend(page["issues"])
+                total = page["total"]
+                if len(issues) >= max_results:
+                    break
+        finally:
+            await pages.aclose()  # cancel any prefetched page right away
+        issues = issues[:max_results]
 
         return {
             "issues": issues,
-            "total": raw_response.get("total", 0),
+            "total": total,
             "displayed": len(issues),
         }
 
-    def get_projects(self):
+    async def get_projects(self):
         """Get a list of available projects"""
         self.logger.info("Getting list of projects")
         endpoint = "project"
-        result = self.get(endpoint)
+        result = await self._cached_get(endpoint, METADATA_CACHE_TTL)
 
         projects = []
         for item in result:
@@ -508,39 +1211,40 @@ class Jira:
                     {"key": item["key"], "name": item["name"], "id": item["id"]}
                 )
             except KeyError as e:
-                self.logger.warning(f"Missing field in project: {e}")
+                self.logger.warning("Missing field in project: %s", e)
 
-        self.logger.debug(f"Retrieved {len(projects)} projects")
+        self.logger.debug("Retrieved %s projects", len(projects))
         return projects
 
-    def get_issue_types(self, project_key: str = None):
+    async def get_issue_types(self, project_key: str = None):
         """Get available issue types, optionally filtered by project"""
         self.logger.info(
-            f"Getting issue types{' for project ' + project_key if project_key else ''}"
+            "Getting issue types%s",
+            " for project " + project_key if project_key else "",
         )
 
         try:
             if project_key:
                 endpoint = f"project/{project_key}"
-                result = self.get(endpoint)
+                result = await self._cached_get(endpoint, METADATA_CACHE_TTL)
                 issue_types = result.get("issueTypes", [])
             else:
                 endpoint = "issuetype"
-                issue_types = self.get(endpoint)
+                issue_types = await self._cached_get(endpoint, METADATA_CACHE_TTL)
 
             return [{"id": it["id"], "name": it["name"]} for it in issue_types]
         except Exception as e:
-            self.logger.error(f"Error getting issue types: {str(e)}", exc_info=True)
+            self.logger.error("Error getting issue types: %s", e, exc_info=True)
             raise JiraApiError(f"Failed to retrieve issue types: {str(e)}") from e
 
-    def get_priorities(self):
+    async def get_priorities(self):
         """Get available priorities"""
         self.logger.info("Getting list of priorities")
         endpoint = "priority"
-        priorities = self.get(endpoint)
+        priorities = await self._cached_get(endpoint, METADATA_CACHE_TTL)
         return [{"id": p["id"], "name": p["name"]} for p in priorities]
 
-    def create_issue(
+    async def create_issue(
         self,
         project_key: str,
         summary: str,
@@ -549,13 +1253,13 @@ class Jira:
         priority: str = None,
     ):
         """Create a new Jira issue"""
-        self.logger.info(f"Creating new issue in project {project_key}")
+        self.logger.info("Creating new issue in project %s", project_key)
         endpoint = "issue"
         default_issue_type = "Task"
         if not issue_type:
             issue_type = default_issue_type
             self.logger.debug(
-                f"No issue type provided, using default: {default_issue_type}"
+                "No issue type provided, using default: %s", default_issue_type
             )
 
         # Build the issue fields
@@ -572,8 +1276,8 @@ class Jira:
         if priority:
             issue_data["fields"]["priority"] = {"name": priority}
 
-        self.logger.debug(f"Creating issue with data: {json.dumps(issue_data)}")
-        result = self.post(endpoint, issue_data)
+        self._debug_json("Creating issue with data", issue_data)
+        result = await self.post(endpoint, issue_data)
 
         return {
             "key": result["key"],
@@ -581,9 +1285,9 @@ class Jira:
             "link": f"{self.base_url}/browse/{result['key']}",
         }
 
-    def add_comment(self, issue_id: str, comment: str):
+    async def add_comment(self, issue_id: str, comment: str):
         """Add a comment to an existing issue"""
-        self.logger.info(f"Adding comment to issue {issue_id}")
+        self.logger.info("Adding comment to issue %s", issue_id)
         endpoint = f"issue/{issue_id}/comment"
 
         # For Jira Data Center, try the simpler format first
@@ -591,7 +1295,7 @@ class Jira:
             # Simple format for Jira Data Center
             comment_data = {"body": comment}
             self.logger.debug("Attempting comment with legacy format")
-            result = self.post(endpoint, comment_data)
+            result = await self.post(endpoint, comment_data)
             return {
                 "id": result["id"],
                 "created": result["created"],
@@ -599,7 +1303,7 @@ class Jira:
             }
         except JiraApiError as e:
             # If simple format fails, try ADF format for Jira Cloud
-            if "400" in str(e):
+            if e.status_code == 400:
                 self.logger.info(
                     "Legacy format failed, trying Atlassian Document Format"
                 )
@@ -615,7 +1319,7 @@ class Jira:
                         ],
                     }
                 }
-                result = self.post(endpoint, comment_data)
+                result = await self.post(endpoint, comment_data)
                 return {
                     "id": result["id"],
                     "created": result["created"],
@@ -624,63 +1328,96 @@ class Jira:
             else:
                 raise
 
-    def get_comments(self, issue_id: str):
+    async def add_comments(
+        self,
+        issue_ids: List[str],
+        comment: str,
+        concurrency: int = ISSUE_FETCH_CONCURRENCY,
+    ):
+        """Post the same comment on several issues concurrently, one failure doesn't abort the rest"""
+        self.logger.info("Adding comment to %s issues", len(issue_ids))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add_one(issue_id: str):
+            async with semaphore:
+                return await self.add_comment(issue_id, comment)
+
+        results = await asyncio.gather(
+            *(add_one(issue_id) for issue_id in issue_ids), return_exceptions=True
+        )
+
+        comments, failures = [], []
+        for issue_id, result in zip(issue_ids, results):
+            if isinstance(result, Exception):
+                self.logger.warning("Failed to comment on %s: %s", issue_id, result)
+                failures.append({"key": issue_id, "error": str(result)})
+            else:
+                comments.append({"key": issue_id, **result})
+        return {"comments": comments, "failures": failures}
+
+    @staticmethod
+    def _adf_text(node: Any):
+        """Yield every text leaf of an Atlassian Document Format node, at any depth"""
+        if not isinstance(node, dict):
+            return
+        if node.get("type") == "text" and "text" in node:
+            yield node["text"]
+        for child in node.get("content") or ():
+            yield from Jira._adf_text(child)
+
+    def _parse_comments(
+        self, raw_comments: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Flatten raw comments, extracting plain text from ADF or legacy bodies"""
+        comments = []
+        for comment in raw_comments:
+            # Handle different comment formats
+            body = comment.get("body")
+            text = ""
+
+            # Try to extract from ADF format
+            if isinstance(body, dict):
+                try:
+                    text = "".join(self._adf_text(body))
+                except TypeError as e:
+                    self.logger.warning("Error parsing ADF comment: %s", e)
+            # Legacy (Data Center / v2) comments are plain strings
+            elif isinstance(body, str):
+                text = body
+
+            # If still no text, use a placeholder
+            if not text:
+                text = "[Comment format not supported]"
+
+            comments.append(
+                {
+                    "id": comment["id"],
+                    "author": comment.get("author", {}).get("displayName", "Unknown"),
+                    "created": comment.get("created", "Unknown"),
+                    "updated": comment.get("updated", "Unknown"),
+                    "text": text,
+                }
+            )
+
+        return comments
+
+    async def get_comments(self, issue_id: str):
         """Get comments for an issue"""
-        self.logger.info(f"Getting comments for issue {issue_id}")
+        self.logger.info("Getting comments for issue %s", issue_id)
         endpoint = f"issue/{issue_id}/comment"
 
         try:
-            result = self.get(endpoint)
-            self.logger.debug(f"Retrieved {len(result.get('comments', []))} comments")
-
-            comments = []
-            for comment in result.get("comments", []):
-                # Handle different comment formats
-                text = ""
-
-                # Try to extract from ADF format
-                if (
-                    "body" in comment
-                    and isinstance(comment["body"], dict)
-                    and "content" in comment["body"]
-                ):
-                    try:
-                        for content in comment["body"]["content"]:
-                            if "content" in content:
-                                for text_content in content["content"]:
-                                    if "text" in text_content:
-                                        text += text_content["text"]
-                    except (KeyError, TypeError) as e:
-                        self.logger.warning(f"Error parsing ADF comment: {e}")
-
-                # Try legacy format if ADF extraction yields nothing
-                if not text and isinstance(comment.get("body"), str):
-                    text = comment["body"]
-
-                # If still no text, use a placeholder
-                if not text:
-                    text = "[Comment format not supported]"
-
-                comments.append(
-                    {
-                        "id": comment["id"],
-                        "author": comment.get("author", {}).get(
-                            "displayName", "Unknown"
-                        ),
-                        "created": comment.get("created", "Unknown"),
-                        "updated": comment.get("updated", "Unknown"),
-                        "text": text,
-                    }
-                )
+            result = await self.get(endpoint)
+            self.logger.debug("Retrieved %s comments", len(result.get("comments", [])))
 
-            return comments
+            return self._parse_comments(result.get("comments", []))
         except Exception as e:
-            self.logger.error(f"Error getting comments: {str(e)}", exc_info=True)
+            self.logger.error("Error getting comments: %s", e, exc_info=True)
             raise JiraApiError(f"Failed to retrieve comments: {str(e)}") from e
 
-    def assign_issue(self, issue_id: str, assignee: str):
+    async def assign_issue(self, issue_id: str, assignee: str):
         """Assign an issue to a user"""
-        self.logger.info(f"Assigning issue {issue_id} to {assignee or 'Unassigned'}")
+        self.logger.info("Assigning issue %s to %s", issue_id, assignee or "Unassigned")
         endpoint = f"issue/{issue_id}/assignee"
 
         # Handle special case for unassigning
@@ -689,7 +1426,7 @@ class Jira:
         else:
             data = {"assignee": {"name": assignee}}
 
-        self.put(endpoint, data)
+        await self.put(endpoint, data)
 
         return {
             "issue_key": issue_id,
@@ -697,49 +1434,74 @@ class Jira:
             "link": f"{self.base_url}/browse/{issue_id}",
         }
 
-    def update_issue_status(
-        self, issue_id: str, transition_id=None, transition_name=None
+    async def update_issue_status(
+        self,
+        issue_id: str,
+        transition_id=None,
+        transition_name=None,
+        transitions=None,
+        verify: bool = False,
     ):
         """
-        Update the status of an issue using either transition ID or name
+        Update the status of an issue using either transition ID or name.
+        Pass transitions already in hand, the raw response or the list from
+        get_available_transitions, to skip fetching them again.
+        The new status is taken from the transition's target; set verify to
+        read it back from the server instead.
         """
         self.logger.info(
-            f"Updating status of issue {issue_id} using {'ID' if transition_id else 'name'} {transition_id or transition_name}"
+            "Updating status of issue %s using %s %s",
+            issue_id,
+            "ID" if transition_id else "name",
+            transition_id or transition_name,
         )
 
         if not (transition_id or transition_name):
             raise ValueError("Either transition_id or transition_name must be provided")
 
-        # First, get available transitions
+        # First, get available transitions unless the caller already has them,
+        # either as the raw response or as get_available_transitions' list
         transitions_endpoint = f"issue/{issue_id}/transitions"
-        transitions = self.get(transitions_endpoint)
-        self.logger.debug(
-            f"Available transitions: {', '.join([t['name'] for t in transitions.get('transitions', [])])}"
-        )
+        if transitions is None:
+            transitions = await self._cached_get(
+                transitions_endpoint, TRANSITIONS_CACHE_TTL
+            )
+        if isinstance(transitions, dict):
+            available = transitions.get("transitions", [])
+        elif isinstance(transitions, list):
+            available = transitions
+        else:
+            raise TypeError(
+                "transitions must be a transitions response or a list of transitions"
+            )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Available transitions: %s", ", ".join(t["name"] for t in available)
+            )
 
         transition_to_use = None
+        target_status = None
 
         # Find the transition by ID or name
         if transition_id:
-            for t in transitions.get("transitions", []):
-                if t["id"] == transition_id:
-                    transition_to_use = t["id"]
-                    break
-        elif transition_name:
-            for t in transitions.get("transitions", []):
-                if t["name"].lower() == transition_name.lower():
-                    transition_to_use = t["id"]
-                    break
+            match = next((t for t in available if t["id"] == transition_id), None)
+        else:
+            name = transition_name.lower()
+            match = next((t for t in available if t["name"].lower() == name), None)
+        if match:
+            transition_to_use = match["id"]
+            # Flattened entries carry "to_status", raw ones a "to" status object
+            to = match.get("to") or {}
+            target_status = match.get("to_status") or to.get("name")
 
         if not transition_to_use:
             available_transitions = ", ".join(
-                [
-                    f"{t['name']} (ID: {t['id']})"
-                    for t in transitions.get("transitions", [])
-                ]
+                [f"{t['name']} (ID: {t['id']})" for t in available]
             )
             self.logger.error(
-                f"Transition {transition_id or transition_name} not found. Available: {available_transitions}"
+                "Transition %s not found. Available: %s",
+                transition_id or transition_name,
+                available_transitions,
             )
             raise JiraApiError(
                 f"Transition not found. Available transitions: {available_transitions}"
@@ -747,22 +1509,28 @@ class Jira:
 
         # Perform the transition
         transition_data = {"transition": {"id": transition_to_use}}
-        self.post(f"issue/{issue_id}/transitions", transition_data)
+        await self.post(transitions_endpoint, transition_data)
+        # The issue's available transitions change with its status
+        self._cache.pop(transitions_endpoint, None)
 
-        # Get updated issue to confirm new status
-        updated_issue = self.get_issue(issue_id, "status")
+        # The transition defines the resulting status, so no confirmation GET
+        # is needed unless asked for, or the response omitted "to"
+        if verify or not target_status:
+            target_status = (await self.get_issue(issue_id, "status"))["status"]
 
         return {
             "issue_key": issue_id,
-            "new_status": updated_issue["status"],
+            "new_status": target_status,
             "link": f"{self.base_url}/browse/{issue_id}",
         }
 
-    def get_available_transitions(self, issue_id: str):
+    async def get_available_transitions(self, issue_id: str):
         """Get available status transitions for an issue"""
-        self.logger.info(f"Getting available transitions for issue {issue_id}")
+        self.logger.info("Getting available transitions for issue %s", issue_id)
         transitions_endpoint = f"issue/{issue_id}/transitions"
-        transitions = self.get(transitions_endpoint)
+        transitions = await self._cached_get(
+            transitions_endpoint, TRANSITIONS_CACHE_TTL
+        )
 
         return [
             {"id": t["id"], "name": t["name"], "to_status": t["to"]["name"]}
@@ -770,10 +1538,73 @@ class Jira:
         ]
 
 
+async def _emit_issues(jira: Jira, issue_ids: List[str], event_emitter: EventEmitter):
+    """
+    Emit details for several issues fetched in one bulk request.  Kept off Tools
+    because Open WebUI turns every non-dunder Tools method into a tool spec.
+    """
+    result = await jira.batch_get_issues(issue_ids, ISSUE_DETAIL_FIELDS)
+
+    # One message event for all the issue tables, then a citation per issue
+    if result["issues"]:
+        await event_emitter.emit_message(
+            "".join(map(IssueFormatter.format_issue_details, result["issues"]))
+        )
+    for issue in result["issues"]:
+        await event_emitter.emit_source(issue["title"], issue["link"])
+
+    if result["failures"]:
+        failed = ", ".join(f["key"] for f in result["failures"])
+        await event_emitter.emit_status(
+            f"Retrieved {len(result['issues'])} issues, failed: {failed}",
+            True,
+            not result["issues"],
+        )
+    else:
+        await event_emitter.emit_status(
+            f"Successfully retrieved {len(result['issues'])} Jira issues", True
+        )
+    return "Success" if result["issues"] else None
+
+
+async def _emit_comments_added(
+    jira: Jira,
+    issue_ids: List[str],
+    comment: str,
+    event_emitter: EventEmitter,
+):
+    """Comment on several issues at once and summarise them in one table"""
+    result = await jira.add_comments(issue_ids, comment)
+
+    rows = [
+        [f"[{c['key']}]({c['issue_link']})", "✅ Added", format_date(c["created"])]
+        for c in result["comments"]
+    ]
+    rows.extend([f["key"], f"❌ {f['error']}", ""] for f in result["failures"])
+    await event_emitter.emit_table(
+        ["Issue", "Result", "Added at"], rows, "💬 Comments Added"
+    )
+
+    if result["failures"]:
+        failed = ", ".join(f["key"] for f in result["failures"])
+        await event_emitter.emit_status(
+            f"Commented on {len(result['comments'])} issues, failed: {failed}",
+            True,
+            not result["comments"],
+        )
+    else:
+        await event_emitter.emit_status(
+            f"Comment added to {len(result['comments'])} issues", True
+        )
+    return None
+
+
 class Tools:
     def __init__(self):
         self.logger = logging.getLogger("jira_tool.tools")
         self.valves = self.Valves()
+        self._jira: Optional[Jira] = None
+        self._jira_key: Optional[tuple] = None
 
     class Valves(BaseModel):
         username: str = Field(
@@ -790,6 +1621,22 @@ class Tools:
             "",
             description="Your Jira base URL (e.g., https://your-company.atlassian.net)",
         )
+        search_batch_size: int = Field(
+            1000,
+            description="Issues requested per search page; lowered automatically to the server's cap (Cloud allows 100)",
+        )
+        requests_per_minute: int = Field(
+            0,
+            description="Max Jira requests per minute, for servers that send no rate-limit headers (0 = no limit)",
+        )
+        max_concurrent_requests: int = Field(
+            AIMD_MAX_CONCURRENCY,
+            description="Most Jira requests in flight at once across all tool calls",
+        )
+        requests_per_second: float = Field(
+            0,
+            description="Evenly space Jira requests at this rate so bursts never exceed it (0 = no pacing)",
+        )
 
         @validator("base_url")
         def validate_url(cls, v):
@@ -805,8 +1652,12 @@ class Tools:
                 raise ValueError("Either PAT or username/password must be provided")
             return v
 
-    def _get_jira_client(self):
-        """Initialize and return a Jira client using valve values"""
+    async def _get_jira_client(self):
+        """
+        Return a Jira client for the current valves, reusing it while they are
+        unchanged.  Use it as `async with` so a replaced client is closed only
+        after the calls using it are done.
+        """
         if not self.valves.base_url:
             raise ValueError(
                 "Jira base URL not configured. Please provide your Jira base URL."
@@ -817,12 +1668,25 @@ class Tools:
             raise ValueError(
                 "Jira credentials not configured. Please provide either username/password or a Personal Access Token."
             )
-        return Jira(
-            self.valves.username,
-            self.valves.password,
-            self.valves.base_url,
-            self.valves.pat,
-        )
+        # Passed by keyword, so the order here never has to track Jira.__init__
+        settings = {
+            "username": self.valves.username,
+            "password": self.valves.password,
+            "base_url": self.valves.base_url,
+            "pat": self.valves.pat,
+            "requests_per_minute": self.valves.requests_per_minute,
+            "max_concurrent_requests": self.valves.max_concurrent_requests,
+            "requests_per_second": self.valves.requests_per_second,
+        }
+        key = tuple(settings.values())
+        if self._jira is None or self._jira_key != key:
+            # Tool calls still running may hold the old client (entered with
+            # `async with`), so it closes when the last of them finishes
+            old, self._jira = self._jira, Jira(**settings)
+            self._jira_key = key
+            if old is not None:
+                await old.retire()
+        return self._jira
 
     async def get_issue(
         self,
@@ -830,44 +1694,56 @@ class Tools:
         __event_emitter__: Callable[[dict], Awaitable[None]],
         __user__: dict = {},
     ):
-        """Get detailed information about a Jira issue by its ID."""
+        """Get detailed information about a Jira issue by its ID, or several comma-separated IDs."""
         event_emitter = EventEmitter(__event_emitter__)
 
         try:
             await event_emitter.emit_status(f"Retrieving Jira issue {issue_id}", False)
-            jira = self._get_jira_client()
-
-            try:
-                # Get issue data
-                issue = jira.get_issue(issue_id)
-
-                # Format issue as markdown table
-                issue_markdown = IssueFormatter.format_issue_details(issue)
-                await event_emitter.emit_message(issue_markdown)
-
-                # Add source citation
-                await event_emitter.emit_source(issue["title"], issue["link"])
-
-                # Get and format comments if any
-                comments = jira.get_comments(issue_id)
-                if comments:
-                    comment_markdown = IssueFormatter.format_comments(
-                        issue_id, comments
+            async with await self._get_jira_client() as jira:
+                issue_ids = [i.strip() for i in issue_id.split(",") if i.strip()]
+                if len(issue_ids) > 1:
+                    return await _emit_issues(jira, issue_ids, event_emitter)
+                if not issue_ids:
+                    raise ValueError("No issue ID given")
+                issue_id = issue_ids[0]  # without stray commas or whitespace
+
+                try:
+                    # The issue payload embeds its first page of comments.  Only when
+                    # Jira reports more than that page holds are the rest fetched,
+                    # after the issue GET; if that fails the embedded page is shown.
+                    issue = await jira.get_issue(issue_id, ISSUE_DETAIL_COMMENT_FIELDS)
+                    comments = issue.get("comments", [])
+                    if issue.get("comment_total", 0) > len(comments):
+                        try:
+                            comments = await jira.get_comments(issue_id)
+                        except JiraApiError as e:
+                            logger.warning(
+                                "Could not load all comments for %s: %s", issue_id, e
+                            )
+
+                    # Issue table and any comments go out as one message event
+                    issue_markdown = IssueFormatter.format_issue_details(issue)
+                    if comments:
+                        issue_markdown += IssueFormatter.format_comments(
+                            issue_id, comments
+                        )
+                    await event_emitter.emit_message(issue_markdown)
+
+                    # Add source citation
+                    await event_emitter.emit_source(issue["title"], issue["link"])
+
+                    await event_emitter.emit_status(
+                        f"Successfully retrieved Jira issue {issue_id}", True
                     )
-                    await event_emitter.emit_message(comment_markdown)
 
-                await event_emitter.emit_status(
-                    f"Successfully retrieved Jira issue {issue_id}", True
-                )
-
-                # Return nothing to avoid duplicate message
-                return "Success"
+                    # Return nothing to avoid duplicate message
+                    return "Success"
 
-            except JiraApiError as e:
-                await event_emitter.emit_status(
-                    f"Failed to get issue {issue_id}: {str(e)}", True, True
-                )
-                return None
+                except JiraApiError as e:
+                    await event_emitter.emit_status(
+                        f"Failed to get issue {issue_id}: {str(e)}", True, True
+                    )
+                    return None
 
         except Exception as e:
             await event_emitter.emit_status(
@@ -887,27 +1763,52 @@ class Tools:
 
         try:
             await event_emitter.emit_status(f"Searching Jira for: {query}", False)
-            jira = self._get_jira_client()
-            results = jira.search(query, max_results)
-
-            if not results["issues"]:
-                await event_emitter.emit_status(
-                    f"No issues found matching: {query}", True
+            async with await self._get_jira_client() as jira:
+                # Emit each page's rows as it arrives instead of waiting for the whole
+                # result set: the first page carries the header, later ones extend it
+                results = {"total": 0, "displayed": 0}
+                pages = jira.search_iter(
+                    query, max_results, self.valves.search_batch_size
                 )
-                return None
-
-            # Format results using the IssueFormatter
-            table_markdown = IssueFormatter.format_issue_list(
-                results["issues"], results["total"], results["displayed"]
-            )
-            await event_emitter.emit_message(table_markdown)
-
-            await event_emitter.emit_status(
-                f"Found {results['total']} issues matching your query", True
-            )
+                try:
+                    async for page in pages:
+                        results["total"] = page["total"]
+                        issues = page["issues"][: max_results - results["displayed"]]
+                        if issues:
+                            await event_emitter.emit_message(
+                                IssueFormatter.format_issue_list(
+                                    issues,
+                                    page["total"],
+                                    min(page["total"], max_results),
+                                    header=not results["displayed"],
+                                )
+                            )
+                            results["displayed"] += len(issues)
+                        if results["displayed"] >= max_results:
+                            break
+                finally:
+                    await pages.aclose()  # cancel any prefetched page right away
+
+                if not results["displayed"]:
+                    await event_emitter.emit_status(
+                        f"No issues found matching: {query}", True
+                    )
+                    return None
+
+                if results["total"] > max_results * BROAD_QUERY_FACTOR:
+                    # Only the first max_results were fetched; say so instead of paging on
+                    await event_emitter.emit_status(
+                        f"Query matches {results['total']} issues; showing the first "
+                        f"{results['displayed']}, narrow it down to see the rest",
+                        True,
+                    )
+                else:
+                    await event_emitter.emit_status(
+                        f"Found {results['total']} issues matching your query", True
+                    )
 
-            # Return nothing to avoid duplicate message
-            return "Successfully retrieved issues"
+                # Return nothing to avoid duplicate message
+                return "Successfully retrieved issues"
 
         except Exception as e:
             await event_emitter.emit_status(
@@ -933,15 +1834,15 @@ class Tools:
                 f"Creating new {issue_type} in project {project_key}", False
             )
 
-            jira = self._get_jira_client()
-            result = jira.create_issue(
-                project_key, summary, description, issue_type, priority
-            )
+            async with await self._get_jira_client() as jira:
+                result = await jira.create_issue(
+                    project_key, summary, description, issue_type, priority
+                )
 
-            creation_time = datetime.now().strftime("%b %d, %Y %I:%M %p")
+                creation_time = time.strftime("%b %d, %Y %I:%M %p")
 
-            # Format success message as a table for consistency
-            success_message = f"""
+                # Format success message as a table for consistency
+                success_message = f"""
 ### ✅ Issue Created Successfully
 
 | Attribute | Value |
@@ -952,13 +1853,13 @@ class Tools:
 | Project | {project_key} |
 | Created | {creation_time} |
 """
-            await event_emitter.emit_message(success_message)
-            await event_emitter.emit_status(
-                f"Successfully created issue {result['key']}", True
-            )
+                await event_emitter.emit_message(success_message)
+                await event_emitter.emit_status(
+                    f"Successfully created issue {result['key']}", True
+                )
 
-            # Return nothing to avoid duplicate message
-            return f"Successfully created issue {result['key']}"
+                # Return nothing to avoid duplicate message
+                return f"Successfully created issue {result['key']}"
 
         except Exception as e:
             await event_emitter.emit_status(
@@ -974,8 +1875,8 @@ class Tools:
         __user__: dict = {},
     ):
         """
-        Add a comment to an existing Jira issue.
-        :param issue_id: The ID of the issue (e.g., PROJECT-123)
+        Add a comment to an existing Jira issue, or the same comment to several.
+        :param issue_id: The ID of the issue (e.g., PROJECT-123), or comma-separated IDs
         :param comment: The comment text to add
         :return: Comment details
         """
@@ -984,21 +1885,121 @@ class Tools:
         try:
             await event_emitter.emit_status(f"Adding comment to {issue_id}", False)
 
-            jira = self._get_jira_client()
-            result = jira.add_comment(issue_id, comment)
+            async with await self._get_jira_client() as jira:
+                issue_ids = [i.strip() for i in issue_id.split(",") if i.strip()]
+                if len(issue_ids) > 1:
+                    return await _emit_comments_added(
+                        jira, issue_ids, comment, event_emitter
+                    )
+                if not issue_ids:
+                    raise ValueError("No issue ID given")
+                issue_id = issue_ids[0]  # without stray commas or whitespace
+
+                result = await jira.add_comment(issue_id, comment)
 
-            confirmation = f"""
+                confirmation = f"""
 ### 💬 Comment Added
 Successfully added a comment to [{issue_id}]({result['issue_link']}).  
 **Added at:** {result['created']}
 """
-            await event_emitter.emit_message(confirmation)
-            await event_emitter.emit_status(f"Comment added to {issue_id}", True)
+                await event_emitter.emit_message(confirmation)
+                await event_emitter.emit_status(f"Comment added to {issue_id}", True)
 
-            return None
+                return None
 
         except Exception as e:
             await event_emitter.emit_status(
                 f"Failed to add comment: {str(e)}", True, True
             )
             return f"Error: {str(e)}"
+
+    async def update_status(
+        self,
+        issue_id: str,
+        status: str,
+        __event_emitter__: Callable[[dict], Awaitable[None]],
+        __user__: dict = {},
+    ):
+        """
+        Move a Jira issue to a new status via one of its available transitions.
+        :param issue_id: The ID of the issue (e.g., PROJECT-123)
+        :param status: The transition name to apply (e.g., In Progress)
+        :return: The new status of the issue
+        """
+        event_emitter = EventEmitter(__event_emitter__)
+
+        try:
+            await event_emitter.emit_status(f"Updating {issue_id} to {status}", False)
+
+            async with await self._get_jira_client() as jira:
+                # update_issue_status looks up the transitions itself, no preflight GET
+                result = await jira.update_issue_status(
+                    issue_id, transition_name=status
+                )
+
+                confirmation = f"""
+### 🔄 Status Updated
+[{issue_id}]({result['link']}) is now **{result['new_status']}**.
+"""
+                await event_emitter.emit_message(confirmation)
+                await event_emitter.emit_status(
+                    f"{issue_id} moved to {result['new_status']}", True
+                )
+
+                return f"{issue_id} moved to {result['new_status']}"
+
+        except Exception as e:
+            await event_emitter.emit_status(
+                f"Failed to update status: {str(e)}", True, True
+            )
+            return f"Error: {str(e)}"
+
+    async def get_issue_metadata(
+        self,
+        project_key: str,
+        __event_emitter__: Callable[[dict], Awaitable[None]],
+        __user__: dict = {},
+    ):
+        """
+        List the issue types and priorities available when creating issues.
+        :param project_key: The project to list issue types for (e.g., PROJECT)
+        :return: Issue type and priority names
+        """
+        event_emitter = EventEmitter(__event_emitter__)
+
+        try:
+            await event_emitter.emit_status(
+                f"Fetching issue metadata for {project_key}", False
+            )
+
+            async with await self._get_jira_client() as jira:
+                # Independent lookups, so fetch them concurrently
+                issue_types, priorities = await asyncio.gather(
+                    jira.get_issue_types(project_key), jira.get_priorities()
+                )
+
+                # Emitted in sequence so the tables always render in the same order
+                await event_emitter.emit_table(
+                    ["ID", "Name"],
+                    [[it["id"], it["name"]] for it in issue_types],
+                    f"Issue Types for {project_key}",
+                )
+                await event_emitter.emit_table(
+                    ["ID", "Name"],
+                    [[p["id"], p["name"]] for p in priorities],
+                    "Priorities",
+                )
+                await event_emitter.emit_status(
+                    f"Retrieved metadata for {project_key}", True
+                )
+
+                return (
+                    f"Issue types: {', '.join(it['name'] for it in issue_types)}. "
+                    f"Priorities: {', '.join(p['name'] for p in priorities)}."
+                )
+
+        except Exception as e:
+            await event_emitter.emit_status(
+                f"Failed to get issue metadata: {str(e)}", True, True
+            )
+            return f"Error: {str(e)}"